@@ -2,12 +2,66 @@
 # layout, here specifically developed to transfer the input values from a
 # GUI saved in a dictionary to an input dictionary for a simulation
 try:
-    import numpy as np
-    NUMPY_FOUND = True
+    import orjson
+    ORJSON_FOUND = True
 except ModuleNotFoundError:
-    NUMPY_FOUND = False
-from typing import Generator
+    ORJSON_FOUND = False
+try:
+    import msgspec
+    MSGSPEC_FOUND = True
+except ModuleNotFoundError:
+    MSGSPEC_FOUND = False
+from collections import deque
+from itertools import repeat
+from typing import Generator, Iterator
 import copy
+import importlib.util
+import math
+import pickle
+import sys
+# numpy is only looked up without importing it, see _is_iterable_like
+NUMPY_FOUND = importlib.util.find_spec('numpy') is not None
+
+__all__ = ['ensure_list', 'remove_key', 'gen_dict_extract',
+           'set_dict_entry', 'get_dict_entry', 'Overlay', 'invalidate_cache',
+           'dict_transfer', 'dict_transfer_iter']
+
+# Sentinel for missing attributes and entries
+_NO_VALUE = object()
+# Marker on the stack of the iterative walks, pushed on top of a dictionary
+# containing the searched key at the position of the key among the children
+# of the dictionary, so that it is found in the order of a recursive walk
+_MATCH = object()
+# Types of children descended into by the walks, in dictionaries and in lists
+_DICT_CHILD_TYPES = (dict, list)
+_LIST_CHILD_TYPES = (dict, list, tuple)
+# Maximum number of dictionaries for which data is cached per cache
+PLAN_CACHE_SIZE = 32
+# Transfer plans of dict_transfer as lists of (access path, sim_names as
+# found, normalized sim_names), keyed by (id(source_dict), target_name_key),
+# holding the source_dict itself to guard against id reuse
+_transfer_plan_cache = {}
+# Keys contained in the nested containers of the dictionaries searched by
+# gen_dict_extract, keyed by id(var), holding var itself to guard against id
+# reuse
+_key_universe_cache = {}
+# Leaf types of JSON-like data, checked by exact type
+_JSON_LEAF_TYPES = (str, int, float, bool, type(None))
+if MSGSPEC_FOUND:
+    _msgpack_encoder = msgspec.msgpack.Encoder()
+    _msgpack_decoder = msgspec.msgpack.Decoder()
+
+
+def _is_iterable_like(variable) -> bool:
+    """
+    Checks whether variable is a list, tuple, or numpy array. Numpy is not
+    imported for this, since variable cannot be a numpy array if numpy was
+    not imported elsewhere.
+    """
+    if isinstance(variable, (list, tuple)):
+        return True
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(variable, numpy.ndarray)
 
 
 def ensure_list(variable, length=1):
@@ -22,12 +76,10 @@ def ensure_list(variable, length=1):
     :return: List with length of parameter 'length' containing the provided
         'variable', only modified if 'variable' not already iterable
     """
-    iterable_list = (list, tuple, np.ndarray) if NUMPY_FOUND \
-        else (list, tuple)
-    if isinstance(variable, iterable_list):
+    if _is_iterable_like(variable):
         return variable
     else:
-        return [variable for i in range(length)]
+        return [variable] * length
 
 
 def remove_key(key: str, var: (dict, list, tuple)) -> (dict, list, tuple):
@@ -45,18 +97,52 @@ def remove_key(key: str, var: (dict, list, tuple)) -> (dict, list, tuple):
     print(results) # {'a': 1, 'b': {'d': ''}}
     ```
     """
-    if isinstance(var, dict):
-        for k in list(var.keys()):
-            if k == key:
-                del var[key]
-            else:
-                remove_key(key, var[k])
-    elif isinstance(var, (list, tuple)):
-        for item in var:
-            remove_key(key, item)
+    stack = deque([var])
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if key in node:
+                del node[key]
+            stack.extend(v for v in node.values()
+                         if isinstance(v, (dict, list, tuple)))
+        elif isinstance(node, (list, tuple)):
+            stack.extend(item for item in node
+                         if isinstance(item, (dict, list, tuple)))
+
+
+def _key_universes(var: (dict, list, tuple)) -> dict:
+    """
+    Returns the sets of all dictionary keys contained in each nested
+    dictionary, list or tuple of var (including var itself), keyed by the id
+    of the respective container. The result is cached per var.
+    """
+    cached = _key_universe_cache.get(id(var))
+    if cached is not None and cached[0] is var:
+        return cached[1]
+    universes = {}
+    # post-order walk, a container is visited again after all its children
+    stack = [(var, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if id(node) in universes:
+            continue
+        children = node.values() if isinstance(node, dict) else node
+        if children_done:
+            universe = set(node) if isinstance(node, dict) else set()
+            for child in children:
+                if isinstance(child, (dict, list, tuple)):
+                    universe.update(universes[id(child)])
+            universes[id(node)] = frozenset(universe)
+        else:
+            stack.append((node, True))
+            stack.extend((child, False) for child in children
+                         if isinstance(child, (dict, list, tuple)))
+    _cache_entry(_key_universe_cache, id(var), var, universes)
+    return universes
 
 
-def gen_dict_extract(key: str, var: (dict, list, tuple)) -> Generator:
+def gen_dict_extract(key: str, var: (dict, list, tuple),
+                     use_cache: bool = False) -> Generator:
     """
     A generator function that extracts all nested dictionaries in a dictionary
     or a list of dictionaries that have a specific key.
@@ -64,6 +150,11 @@ def gen_dict_extract(key: str, var: (dict, list, tuple)) -> Generator:
     :param key: the key to search for in the dictionaries.
     :param var: the dictionary or list of
                                dictionaries to search in.
+    :param use_cache: if True, the keys contained in each nested container of
+        'var' are cached, so that repeated searches skip all subtrees without
+        the key, which pays off for large structures with few matches.
+        Requires invalidate_cache(var) after structural changes of 'var'.
+        Default is False.
     :return: A generator that yields all the nested dictionaries that contain
         the key.
 
@@ -74,21 +165,33 @@ def gen_dict_extract(key: str, var: (dict, list, tuple)) -> Generator:
     print(results) # [{'c': 2}, {'c': 3}]
     ```
     """
-    if isinstance(var, dict):
-        for k, v in var.items():
-            if k == key:
-                yield var
-            if isinstance(v, dict):
-                for result in gen_dict_extract(key, v):
-                    yield result
-            elif isinstance(v, list):
-                for d in v:
-                    for result in gen_dict_extract(key, d):
-                        yield result
-    elif isinstance(var, (list, tuple)):
-        for d in var:
-            for result in gen_dict_extract(key, d):
-                yield result
+    universes = _key_universes(var) if use_cache else {}
+    stack = deque([var])
+    while stack:
+        node = stack.pop()
+        if node is _MATCH:
+            yield stack.pop()
+        elif universes and key not in universes.get(id(node), (key,)):
+            # key is not contained anywhere in this subtree
+            continue
+        elif isinstance(node, dict):
+            # push children in reverse to keep the depth-first order of the
+            # recursive version
+            if key in node:
+                for k, v in reversed(node.items()):
+                    if isinstance(v, _DICT_CHILD_TYPES):
+                        stack.append(v)
+                    if k == key:
+                        stack.append(node)
+                        stack.append(_MATCH)
+            else:
+                for v in reversed(node.values()):
+                    if isinstance(v, _DICT_CHILD_TYPES):
+                        stack.append(v)
+        elif isinstance(node, (list, tuple)):
+            for d in reversed(node):
+                if isinstance(d, _LIST_CHILD_TYPES):
+                    stack.append(d)
     # else:
     #     raise TypeError('Provided data structure must be either dict, list, '
     #                     'or tuple')
@@ -109,25 +212,22 @@ def set_dict_entry(value, key_list: list, target_dict: dict,
     :param value: The value to be set
     :param key_list: A list of keys that specify the location where the value
         should be set
-    :param target_dict: The dictionary in which the value should be set
+    :param target_dict: The dictionary in which the value should be set, must
+        be a dict (other types fail on indexing)
     :param mode: The mode of operation, either "moderate" or "strict"
         (default is "moderate")
     :return: The modified target dictionary
     """
-    if isinstance(target_dict, dict):
-        sub_dict = target_dict
-    else:
-        raise TypeError
-    for i in range(len(key_list) - 1):
-        sub_dict = sub_dict[key_list[i]]
+    sub_dict = target_dict
+    for k in key_list[:-1]:
+        sub_dict = sub_dict[k]
 
-    if key_list[-1] in sub_dict:
-        if hasattr(value, 'value'):
-            pure_value = value.value
-        else:
+    last_key = key_list[-1]
+    if last_key in sub_dict:
+        pure_value = getattr(value, 'value', _NO_VALUE)
+        if pure_value is _NO_VALUE:
             pure_value = value
-        sub_dict[key_list[-1]] = pure_value
-        flag_found = True
+        sub_dict[last_key] = pure_value
     else:
         if mode == "strict":
             raise NameError(f'Key {key_list} was not found in settings.json')
@@ -144,18 +244,377 @@ def get_dict_entry(key_list: (list, tuple), source_dict: dict):
 
     :param key_list: list of keys to locate entry in a nested dictionary
                      ordered from highest to lowest hierarchy
-    :param source_dict: dictionary to retrieve value from
+    :param source_dict: dictionary to retrieve value from, must be a dict
+        (other types fail on indexing)
     :return: retrieved value
     """
-    if isinstance(source_dict, dict):
-        sub_dict = source_dict
-    else:
-        raise TypeError
-    for i in range(len(key_list) - 1):
-        sub_dict = sub_dict[key_list[i]]
+    sub_dict = source_dict
+    for k in key_list[:-1]:
+        sub_dict = sub_dict[k]
     return sub_dict[key_list[-1]]
 
 
+def _is_json_safe(var) -> bool:
+    """
+    Checks whether var is JSON-like data, i.e. only consists of dictionaries
+    with string keys, lists, strings, integers, finite floats, booleans and
+    None, which can be copied by a serialization round trip without changing
+    its types. Containers occurring more than once, e.g. in cyclic data, are
+    not JSON-like.
+    """
+    visited = set()
+    stack = [var]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is dict or node_type is list:
+            if id(node) in visited:
+                return False
+            visited.add(id(node))
+            if node_type is list:
+                stack.extend(node)
+            elif all(type(k) is str for k in node):
+                stack.extend(node.values())
+            else:
+                return False
+        elif node_type is float:
+            if not math.isfinite(node):
+                return False
+        elif node_type not in _JSON_LEAF_TYPES:
+            return False
+    return True
+
+
+def _fast_deepcopy(var):
+    """
+    Creates a deep copy of var. JSON-like data is copied by a serialization
+    round trip (orjson or msgspec if available, pickle otherwise), which runs
+    in compiled code and is considerably faster than copy.deepcopy, used for
+    any other data. Since these round trips do not preserve containers
+    shared between several entries, data with shared containers is not
+    JSON-like, see _is_json_safe, and is copied by copy.deepcopy as well.
+    Whether var is JSON-like is checked anew on every call.
+    """
+    if _is_json_safe(var):
+        if ORJSON_FOUND:
+            try:
+                return orjson.loads(orjson.dumps(var))
+            except orjson.JSONEncodeError:
+                # e.g. integers exceeding 64 bit or invalid unicode
+                pass
+        if MSGSPEC_FOUND:
+            try:
+                return _msgpack_decoder.decode(_msgpack_encoder.encode(var))
+            except (msgspec.EncodeError, TypeError, ValueError,
+                    OverflowError):
+                # e.g. integers exceeding 64 bit or invalid unicode
+                pass
+        return pickle.loads(pickle.dumps(var, pickle.HIGHEST_PROTOCOL))
+    return copy.deepcopy(var)
+
+
+def _apply_updates(var: dict, updates: dict):
+    """
+    Sets the values of updates, given as {key path tuple: value}, in the
+    nested dictionary var in order. Consecutive updates of entries in the
+    same nested dictionary, as produced by GUI entries of the same frame,
+    share a single descent to this dictionary.
+    """
+    parent_path = None
+    for path, value in updates.items():
+        if path[:-1] != parent_path:
+            parent_path = path[:-1]
+            sub_dict = _walk(var, parent_path)
+        sub_dict[path[-1]] = value
+
+
+class Overlay:
+    """
+    Copy-on-write view of a nested dictionary. Entries set on the overlay are
+    recorded as changes by their key paths, while the base dictionary stays
+    untouched. A modified copy of the base dictionary is only created on
+    demand by materialize.
+
+    :param base: the nested dictionary to view
+    """
+    __slots__ = ('base', 'changes', '_parents', '_parent_prefixes')
+
+    def __init__(self, base: dict):
+        self.base = base
+        self.changes = {}
+        # containers of the current state by their key paths, so that
+        # setting sibling entries skips the descent through the nested
+        # dictionaries, and all prefixes of these paths to drop them once
+        # an entry on the way to them is changed
+        self._parents = {}
+        self._parent_prefixes = set()
+
+    def get_entry(self, key_list: (list, tuple)):
+        """
+        Get an entry of the overlay according to the given list of keys,
+        falling back to the base dictionary for unchanged entries.
+
+        :param key_list: list of keys to locate entry in the nested dictionary
+                         ordered from highest to lowest hierarchy
+        :return: retrieved value
+        """
+        path = tuple(key_list)
+        for i in range(len(path), 0, -1):
+            if path[:i] in self.changes:
+                return _walk(self.changes[path[:i]], path[i:])
+        return _walk(self.base, path)
+
+    def set_entry(self, value, key_list: (list, tuple),
+                  mode: str = "moderate") -> 'Overlay':
+        """
+        Sets an entry of the overlay, see set_dict_entry for the handling of
+        keys not found in the base dictionary.
+
+        :param value: The value to be set
+        :param key_list: A list of keys that specify the location where the
+            value should be set
+        :param mode: The mode of operation, either "moderate" or "strict"
+            (default is "moderate")
+        :return: The overlay itself
+        """
+        pure_value = getattr(value, 'value', _NO_VALUE)
+        if pure_value is _NO_VALUE:
+            pure_value = value
+        return self._set_pure_entry(pure_value, tuple(key_list), mode)
+
+    def _set_pure_entry(self, pure_value, path: tuple,
+                        mode: str = "moderate") -> 'Overlay':
+        """
+        Sets an entry of the overlay like set_entry, for a value which is not
+        unwrapped anymore and a key path given as tuple.
+        """
+        parent_path = path[:-1]
+        sub_dict = self._parents.get(parent_path, _NO_VALUE)
+        if sub_dict is _NO_VALUE:
+            sub_dict = self.get_entry(parent_path)
+            self._parents[parent_path] = sub_dict
+            self._parent_prefixes.update(
+                parent_path[:i] for i in range(len(parent_path) + 1))
+        if path[-1] in sub_dict:
+            if path in self._parent_prefixes:
+                # the remembered containers inside the entry are replaced
+                self._parents.clear()
+                self._parent_prefixes.clear()
+            # the current value of the entry, sub_dict only reflects changes
+            # of its own or a higher level
+            current_value = self.changes.get(path, _NO_VALUE)
+            if current_value is _NO_VALUE:
+                current_value = sub_dict[path[-1]]
+            if isinstance(current_value, (dict, list)):
+                # previous changes inside the replaced entry are void
+                depth = len(path)
+                for p in [p for p in self.changes if p[:depth] == path]:
+                    del self.changes[p]
+            self.changes[path] = pure_value
+        else:
+            if mode == "strict":
+                raise NameError(f'Key {list(path)} was not found in '
+                                f'settings.json')
+            else:
+                print(f'Key {list(path)} was not found in settings.json')
+        return self
+
+    def materialize(self) -> dict:
+        """
+        Creates a copy of the base dictionary with all changes applied.
+
+        :return: the modified copy of the base dictionary
+        """
+        var = _fast_deepcopy(self.base)
+        _apply_updates(var, self.changes)
+        return var
+
+
+def invalidate_cache(var: (dict, list, tuple) = None):
+    """
+    Invalidates the cached data of this module, i.e. the transfer plans
+    used by dict_transfer and the keys used by gen_dict_extract
+    with use_cache=True. Must be called after structural changes of a
+    dictionary that was already passed to these functions, see
+    dict_transfer for the changes which are detected automatically. Changes
+    of values only never require invalidation.
+
+    :param var: the dictionary to drop the cached data for, if None
+        (default), all cached data is dropped
+    """
+    if var is None:
+        _transfer_plan_cache.clear()
+        _key_universe_cache.clear()
+    else:
+        for cache_key in [k for k in _transfer_plan_cache if k[0] == id(var)]:
+            del _transfer_plan_cache[cache_key]
+        _key_universe_cache.pop(id(var), None)
+
+
+def _cache_entry(cache: dict, cache_key, var, data):
+    """
+    Stores data belonging to var in one of the module caches, dropping the
+    oldest entry if the cache is full.
+    """
+    if cache_key not in cache and len(cache) >= PLAN_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[cache_key] = (var, data)
+
+
+def _walk(var: (dict, list, tuple), access_path: tuple):
+    """
+    Returns the entry of a nested data structure located at the given path
+    of keys and indices.
+    """
+    for k in access_path:
+        var = var[k]
+    return var
+
+
+def _intern_key(key):
+    """Interns key if it is a string."""
+    return sys.intern(key) if type(key) is str else key
+
+
+def _intern_sim_names(sim_names) -> (list, tuple):
+    """
+    Normalizes the sim_names of a GUI entry to tuples of interned strings,
+    which cache their hash and speed up the key lookups in the target
+    dictionary. A single name path becomes a tuple, while multiple name paths
+    become a list of (name path tuple, value indices) pairs. The value
+    indices are the trailing list of a name path as tuple, or None if the
+    name path does not end with a list.
+    """
+    sim_names = ensure_list(sim_names)
+    if isinstance(sim_names[0], list):
+        normalized = []
+        for sim_name_list in sim_names:
+            if isinstance(sim_name_list[-1], list):
+                normalized.append((tuple(map(_intern_key, sim_name_list[:-1])),
+                                   tuple(sim_name_list[-1])))
+            else:
+                normalized.append((tuple(map(_intern_key, sim_name_list)),
+                                   None))
+        return normalized
+    return tuple(map(_intern_key, sim_names))
+
+
+def _get_cached_gui_entries(key: str, source_dict: dict) -> (list, None):
+    """
+    Returns all nested dictionaries of source_dict containing the given key
+    as a list of (gui_entry, sim_names) tuples by following the cached access
+    paths of a previous _walk_updates. The sim_names are normalized by
+    _intern_sim_names. Returns None if no valid transfer plan is cached, or
+    if an entry was moved, removed or got different sim_names since.
+    """
+    cached = _transfer_plan_cache.get((id(source_dict), key))
+    if cached is None or cached[0] is not source_dict:
+        return None
+    gui_entries = []
+    try:
+        for access_path, raw_sim_names, sim_names in cached[1]:
+            gui_entry = _walk(source_dict, access_path)
+            if gui_entry[key] != raw_sim_names:
+                # sim_names changed without invalidation
+                return None
+            gui_entries.append((gui_entry, sim_names))
+    except (KeyError, IndexError, TypeError):
+        # structure changed without invalidation, plan must be rebuilt
+        return None
+    return gui_entries
+
+
+def _entry_updates(gui_entry: dict, sim_names: (list, tuple),
+                   value_key: str) -> Iterator:
+    """
+    Yields the updates of the simulation variables of a single GUI entry as
+    (key path tuple, pure value, mode) tuples, see dict_transfer. The pure
+    value is _NO_VALUE if the GUI entry has no value.
+    """
+    if isinstance(sim_names, list):
+        gui_values = ensure_list(gui_entry[value_key])
+        n_values = len(gui_values)
+        last_value = gui_values[-1]
+
+        if len(sim_names) == n_values:
+            # one value per variable
+            sim_names_values = zip(sim_names, gui_values)
+        else:
+            sim_names_values = zip(sim_names, repeat(gui_values[0]))
+
+        for (sim_name_list, indices), gui_value in sim_names_values:
+            if indices is not None:
+                # indices exceeding the values refer to the last value
+                values = [gui_values[j] if -n_values <= j < n_values
+                          else last_value for j in indices]
+                value_list = [getattr(value, 'value', value)
+                              for value in values]
+                yield sim_name_list, value_list, "moderate"
+            else:
+                pure_value = getattr(gui_value, 'value', gui_value)
+                yield sim_name_list, pure_value, "moderate"
+
+    else:
+        gui_value = gui_entry.get(value_key, _NO_VALUE)
+        yield sim_names, getattr(gui_value, 'value', gui_value), "strict"
+
+
+def _walk_updates(source_dict: dict, target_name_key: str,
+                  value_key: str) -> Iterator:
+    """
+    Walks source_dict in the order of gen_dict_extract and yields the updates
+    of each GUI entry containing target_name_key as soon as it is found, see
+    _entry_updates. The access paths of the entries are cached as transfer
+    plan once the walk is completed, so that subsequent calls on the same
+    structure can use _get_cached_gui_entries instead of walking the whole
+    tree.
+    """
+    plan = []
+    stack = deque([((), source_dict)])
+    while stack:
+        access_path, node = stack.pop()
+        if node is _MATCH:
+            access_path, node = stack.pop()
+            raw_sim_names = node[target_name_key]
+            sim_names = _intern_sim_names(raw_sim_names)
+            plan.append((access_path, copy.deepcopy(raw_sim_names),
+                         sim_names))
+            yield from _entry_updates(node, sim_names, value_key)
+        elif isinstance(node, dict):
+            if target_name_key in node:
+                for k, v in reversed(node.items()):
+                    if isinstance(v, _DICT_CHILD_TYPES):
+                        stack.append((access_path + (k,), v))
+                    if k == target_name_key:
+                        stack.append((access_path, node))
+                        stack.append((access_path, _MATCH))
+            else:
+                for k, v in reversed(node.items()):
+                    if isinstance(v, _DICT_CHILD_TYPES):
+                        stack.append((access_path + (k,), v))
+        elif isinstance(node, (list, tuple)):
+            for i in range(len(node) - 1, -1, -1):
+                if isinstance(node[i], _LIST_CHILD_TYPES):
+                    stack.append((access_path + (i,), node[i]))
+
+    _cache_entry(_transfer_plan_cache, (id(source_dict), target_name_key),
+                 source_dict, plan)
+
+
+def _iter_updates(source_dict: dict, target_name_key: str,
+                  value_key: str) -> Iterator:
+    """
+    Yields the updates of all GUI entries in source_dict, following the
+    cached transfer plan if available, see _entry_updates.
+    """
+    gui_entries = _get_cached_gui_entries(target_name_key, source_dict)
+    if gui_entries is None:
+        yield from _walk_updates(source_dict, target_name_key, value_key)
+    else:
+        for gui_entry, sim_names in gui_entries:
+            yield from _entry_updates(gui_entry, sim_names, value_key)
+
+
 def dict_transfer(source_dict: dict, target_dict: dict,
                   target_name_key="sim_name", value_key="value") -> object:
     """
@@ -197,6 +656,13 @@ def dict_transfer(source_dict: dict, target_dict: dict,
     - Each element of the sublist is a list of strings that represents the
       name of a variable.
 
+    The locations and sim_names of the GUI elements in the `source_dict`
+    are cached, so that repeated calls with the same `source_dict` only
+    re-read the values. Moved, removed or renamed GUI elements are detected
+    automatically, but after adding GUI elements to the `source_dict`,
+    `dict_transfer.invalidate()` must be called. The `target_dict` is not
+    cached and may be changed freely between calls.
+
     :param source_dict: A dictionary of GUI elements and their values.
     :param target_dict: A dictionary of simulation input variables and their
                         default values.
@@ -208,56 +674,47 @@ def dict_transfer(source_dict: dict, target_dict: dict,
     :return: A tuple containing an updated copy of `target_dict`, and a list of
              lists of simulation variable names that were updated.
     """
-    target_dict_copy = copy.deepcopy(target_dict)
+    # record updates in an overlay and copy target_dict only once at the end
+    target_overlay = Overlay(target_dict)
 
     # get only widgets with sim_names
     name_lists = []
-    extracted_gui_entries = list(gen_dict_extract(target_name_key, source_dict))
-    if extracted_gui_entries:
-        for gui_entry in extracted_gui_entries:
-            sim_names = gui_entry[target_name_key]
-            sim_names = ensure_list(sim_names)
-            sub_dict = target_dict_copy
-
-            if isinstance(sim_names[0], list):
-                gui_values = ensure_list(gui_entry[value_key])
-
-                # if len(sim_names) != len(gui_values):
-                #     gui_values = [gui_values[0] for i in range(len(sim_names))]
-                if len(sim_names) == len(gui_values):
-                    multi_variable = True
-                else:
-                    multi_variable = False
-
-                for i, sim_name_list in enumerate(sim_names):
-                    if isinstance(sim_name_list[-1], list):
-                        pure_name_list = sim_name_list[:-1]
-                        name_lists.append(pure_name_list)
-                        value_list = []
-                        for j in sim_name_list[-1]:
-                            try:
-                                value = gui_values[j]
-                            except IndexError:
-                                value = gui_values[-1]
-                            if hasattr(value, 'value'):
-                                pure_value = value.value
-                            else:
-                                pure_value = value
-                            value_list.append(pure_value)
-                        sub_dict = \
-                            set_dict_entry(value_list, pure_name_list,
-                                           sub_dict)
-                    else:
-                        name_lists.append(sim_name_list)
-                        gui_value = gui_values[i] if multi_variable \
-                            else gui_values[0]
-                        sub_dict = set_dict_entry(gui_value, sim_name_list,
-                                                  sub_dict)
+    for path, pure_value, mode in _iter_updates(source_dict, target_name_key,
+                                                value_key):
+        name_lists.append(list(path))
+        if pure_value is not _NO_VALUE:
+            target_overlay._set_pure_entry(pure_value, path, mode)
+    return target_overlay.materialize(), name_lists
 
-            else:
-                name_lists.append(sim_names)
-                if value_key in gui_entry:
-                    sub_dict = \
-                        set_dict_entry(gui_entry[value_key], sim_names,
-                                       sub_dict, mode="strict")
-    return target_dict_copy, name_lists
\ No newline at end of file
+
+# hook for the GUI to call on structural edits of the source dictionary
+dict_transfer.invalidate = invalidate_cache
+
+
+def dict_transfer_iter(source_dict: dict, target_name_key="sim_name",
+                       value_key="value") -> Iterator:
+    """
+    Yields the updates of simulation variables from a dictionary of GUI
+    elements without copying or modifying any target dictionary.
+
+    This is the streaming counterpart of dict_transfer for callers which
+    only process the updates one by one, e.g. for logging, displaying
+    differences or applying them incrementally via set_dict_entry. The
+    updates are yielded in the same order as dict_transfer applies them,
+    GUI elements without value are skipped.
+
+    :param source_dict: A dictionary of GUI elements and their values, see
+                        dict_transfer.
+    :param target_name_key: A string indicating the key in the 'source_dict'
+                     containing the list of names mapping to the
+                     corresponding simulation variable
+    :param value_key: A string indicating the key for the values in the
+                      'source_dict'
+    :return: A generator yielding (name_list, value) tuples, with the list of
+             strings representing the name of a simulation variable and its
+             new value.
+    """
+    for path, pure_value, mode in _iter_updates(source_dict, target_name_key,
+                                                value_key):
+        if pure_value is not _NO_VALUE:
+            yield list(path), pure_value
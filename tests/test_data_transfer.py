@@ -0,0 +1,287 @@
+import contextlib
+import io
+import unittest
+
+import data_transfer
+
+
+class Value:
+    """GUI value object exposing its value as attribute."""
+
+    def __init__(self, value):
+        self.value = value
+
+
+class TestDictTransfer(unittest.TestCase):
+
+    def assertTransfer(self, source_dict, target_dict, expected):
+        for _ in range(2):
+            # the second call uses the cached transfer plan
+            self.assertEqual(
+                data_transfer.dict_transfer(source_dict, target_dict),
+                expected)
+
+    def test_readme_example(self):
+        source_dict = \
+            {'temperature': {'sim_name': 'ambient_temp', 'value': '25'}}
+        target_dict = {'ambient_temp': {'value': '20'}}
+        self.assertTransfer(source_dict, target_dict,
+                            ({'ambient_temp': '25'}, [['ambient_temp']]))
+        self.assertEqual(target_dict, {'ambient_temp': {'value': '20'}})
+
+    def test_nested_entries(self):
+        source_dict = {'frame': {'t': {'sim_name': ['sim', 'temp'],
+                                       'value': 300},
+                                 'p': {'sim_name': ['sim', 'pres'],
+                                       'value': 1e5}}}
+        target_dict = {'sim': {'temp': 0, 'pres': 0, 'x': 1}}
+        self.assertTransfer(
+            source_dict, target_dict,
+            ({'sim': {'temp': 300, 'pres': 1e5, 'x': 1}},
+             [['sim', 'temp'], ['sim', 'pres']]))
+
+    def test_entry_order(self):
+        source_dict = {'a': {'sim_name': ['t'], 'value': 1},
+                       'b': [{'sim_name': ['t'], 'value': 2}],
+                       'c': {'d': {'sim_name': ['t'], 'value': 3}}}
+        self.assertTransfer(source_dict, {'t': 0},
+                            ({'t': 3}, [['t'], ['t'], ['t']]))
+
+    def test_one_value_per_variable(self):
+        source_dict = {'w': {'sim_name': [['a'], ['b']], 'value': [1, 2]}}
+        self.assertTransfer(source_dict, {'a': 0, 'b': 0},
+                            ({'a': 1, 'b': 2}, [['a'], ['b']]))
+
+    def test_repeated_value(self):
+        source_dict = {'w': {'sim_name': [['a'], ['b']], 'value': 5}}
+        self.assertTransfer(source_dict, {'a': 0, 'b': 0},
+                            ({'a': 5, 'b': 5}, [['a'], ['b']]))
+
+    def test_indexed_values(self):
+        # index 5 exceeds the values and refers to the last value
+        source_dict = {'w': {'sim_name': [['a', [0, 1]], ['b', [1, 5]]],
+                             'value': [1, 2, 3]}}
+        self.assertTransfer(source_dict, {'a': 0, 'b': 0},
+                            ({'a': [1, 2], 'b': [2, 3]}, [['a'], ['b']]))
+
+    def test_tuple_key(self):
+        # only a trailing list holds value indices, not a tuple key
+        source_dict = {'w': {'sim_name': [['s', ('x', 1)]], 'value': [5]}}
+        self.assertTransfer(source_dict, {'s': {('x', 1): 0}},
+                            ({'s': {('x', 1): 5}}, [['s', ('x', 1)]]))
+
+    def test_value_objects(self):
+        source_dict = {'w': {'sim_name': ['a'], 'value': Value(7)},
+                       'u': {'sim_name': [['b'], ['c']],
+                             'value': [Value(8), Value(9)]}}
+        self.assertTransfer(source_dict, {'a': 0, 'b': 0, 'c': 0},
+                            ({'a': 7, 'b': 8, 'c': 9},
+                             [['a'], ['b'], ['c']]))
+
+    def test_entry_without_value(self):
+        source_dict = {'w': {'sim_name': ['a']}}
+        self.assertTransfer(source_dict, {'a': 0}, ({'a': 0}, [['a']]))
+
+    def test_strict_mode(self):
+        source_dict = {'w': {'sim_name': ['z'], 'value': 1}}
+        with self.assertRaises(NameError):
+            data_transfer.dict_transfer(source_dict, {'a': 0})
+
+    def test_moderate_mode(self):
+        source_dict = {'w': {'sim_name': [['a'], ['z']], 'value': [1, 2]}}
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertTransfer(source_dict, {'a': 0},
+                                ({'a': 1}, [['a'], ['z']]))
+        self.assertEqual(output.getvalue(),
+                         "Key ['z'] was not found in settings.json\n" * 2)
+
+    def test_custom_keys(self):
+        source_dict = {'w': {'target': ['a'], 'val': 1, 'sim_name': ['b'],
+                             'value': 2}}
+        self.assertEqual(
+            data_transfer.dict_transfer(source_dict, {'a': 0, 'b': 0},
+                                        target_name_key='target',
+                                        value_key='val'),
+            ({'a': 1, 'b': 0}, [['a']]))
+        self.assertEqual(
+            data_transfer.dict_transfer(source_dict, {'a': 0, 'b': 0}),
+            ({'a': 0, 'b': 2}, [['b']]))
+
+    def test_dict_transfer_iter(self):
+        source_dict = {'w': {'sim_name': [['a', [0, 1]], ['b']],
+                             'value': [1, 2]},
+                       'u': {'sim_name': ['c']},
+                       'v': {'sim_name': ['d', 'e'], 'value': Value(3)}}
+        self.assertEqual(list(data_transfer.dict_transfer_iter(source_dict)),
+                         [(['a'], [1, 2]), (['b'], 2), (['d', 'e'], 3)])
+
+
+class TestSearchOrder(unittest.TestCase):
+    """
+    Nested dictionaries must be found in the order of the original recursive
+    walk, i.e. a dictionary is found when its key is reached among its items.
+    """
+    data = {'x': {'d': {'c': 3}, 'c': 2, 'e': [{'c': 4}]},
+            'y': [{'c': 5, 'f': {'c': 6}}]}
+    expected = [{'c': 3}, data['x'], {'c': 4}, data['y'][0], {'c': 6}]
+
+    def test_gen_dict_extract(self):
+        self.assertEqual(list(data_transfer.gen_dict_extract('c', self.data)),
+                         self.expected)
+
+    def test_gen_dict_extract_cached(self):
+        for _ in range(2):
+            self.assertEqual(
+                list(data_transfer.gen_dict_extract('c', self.data,
+                                                    use_cache=True)),
+                self.expected)
+        data_transfer.invalidate_cache(self.data)
+
+    def test_dict_transfer_order(self):
+        source_dict = {'g': {'a': {'sim_name': ['t'], 'value': 1},
+                             'sim_name': ['t'], 'value': 2}}
+        for _ in range(2):
+            result = data_transfer.dict_transfer(source_dict, {'t': 0})
+            self.assertEqual(result, ({'t': 2}, [['t'], ['t']]))
+
+
+class TestTransferPlanCache(unittest.TestCase):
+
+    def setUp(self):
+        self.source_dict = {'a': {'sim_name': ['x'], 'value': 1}}
+        self.target_dict = {'x': 0, 'y': 0}
+
+    def transfer(self):
+        return data_transfer.dict_transfer(self.source_dict, self.target_dict)
+
+    def test_renamed_entry(self):
+        self.assertEqual(self.transfer(), ({'x': 1, 'y': 0}, [['x']]))
+        self.source_dict['a']['sim_name'] = ['y']
+        self.assertEqual(self.transfer(), ({'x': 0, 'y': 1}, [['y']]))
+        self.source_dict['a']['sim_name'][0] = 'x'
+        self.assertEqual(self.transfer(), ({'x': 1, 'y': 0}, [['x']]))
+
+    def test_removed_entry(self):
+        self.transfer()
+        del self.source_dict['a']
+        self.assertEqual(self.transfer(), ({'x': 0, 'y': 0}, []))
+
+    def test_added_entry_requires_invalidation(self):
+        self.transfer()
+        self.source_dict['b'] = {'sim_name': ['y'], 'value': 2}
+        self.assertEqual(self.transfer(), ({'x': 1, 'y': 0}, [['x']]))
+        data_transfer.dict_transfer.invalidate(self.source_dict)
+        self.assertEqual(self.transfer(),
+                         ({'x': 1, 'y': 2}, [['x'], ['y']]))
+
+    def test_changed_value(self):
+        self.transfer()
+        self.source_dict['a']['value'] = 3
+        self.assertEqual(self.transfer(), ({'x': 3, 'y': 0}, [['x']]))
+
+    def test_invalidate_all(self):
+        self.transfer()
+        self.source_dict['b'] = {'sim_name': ['y'], 'value': 2}
+        data_transfer.invalidate_cache()
+        self.assertEqual(self.transfer(),
+                         ({'x': 1, 'y': 2}, [['x'], ['y']]))
+
+    def test_invalidate_other_dict(self):
+        self.transfer()
+        self.source_dict['b'] = {'sim_name': ['y'], 'value': 2}
+        data_transfer.invalidate_cache({})
+        self.assertEqual(self.transfer(), ({'x': 1, 'y': 0}, [['x']]))
+
+    def test_plans_per_target_name_key(self):
+        self.source_dict['a']['other_name'] = ['y']
+        self.assertEqual(self.transfer(), ({'x': 1, 'y': 0}, [['x']]))
+        self.assertEqual(
+            data_transfer.dict_transfer(self.source_dict, self.target_dict,
+                                        target_name_key='other_name'),
+            ({'x': 0, 'y': 1}, [['y']]))
+        self.assertEqual(self.transfer(), ({'x': 1, 'y': 0}, [['x']]))
+
+    def test_moved_entry(self):
+        self.transfer()
+        self.source_dict['b'] = self.source_dict.pop('a')
+        self.assertEqual(self.transfer(), ({'x': 1, 'y': 0}, [['x']]))
+
+
+class TestTargetChanges(unittest.TestCase):
+
+    def setUp(self):
+        self.source_dict = {'a': {'sim_name': ['s', 'k'], 'value': 1}}
+
+    def test_removed_target_entry_strict(self):
+        target_dict = {'s': {'k': 0}}
+        self.assertEqual(
+            data_transfer.dict_transfer(self.source_dict, target_dict),
+            ({'s': {'k': 1}}, [['s', 'k']]))
+        del target_dict['s']['k']
+        with self.assertRaises(NameError):
+            data_transfer.dict_transfer(self.source_dict, target_dict)
+
+    def test_self_referencing_target(self):
+        target_dict = {'s': {'k': 0}}
+        target_dict['s']['self'] = target_dict
+        result, name_lists = data_transfer.dict_transfer(self.source_dict,
+                                                         target_dict)
+        self.assertEqual(result['s']['k'], 1)
+        self.assertIs(result['s']['self'], result)
+        self.assertEqual(target_dict['s']['k'], 0)
+
+    def test_replaced_parent(self):
+        overlay = data_transfer.Overlay({'s': {'k': 0, 'l': 0}})
+        overlay.set_entry(1, ['s', 'k'])
+        overlay.set_entry({'m': 0}, ['s'])
+        with self.assertRaises(NameError):
+            overlay.set_entry(2, ['s', 'k'], mode="strict")
+        overlay.set_entry(3, ['s', 'm'], mode="strict")
+        self.assertEqual(overlay.materialize(), {'s': {'m': 3}})
+
+    def test_replaced_changed_entry(self):
+        source_dict = {'a': {'sim_name': ['s'], 'value': {'k': 0}},
+                       'b': {'sim_name': ['s', 'k'], 'value': 5},
+                       'c': {'sim_name': ['s'], 'value': 7}}
+        self.assertEqual(
+            data_transfer.dict_transfer(source_dict, {'s': 0}),
+            ({'s': 7}, [['s'], ['s', 'k'], ['s']]))
+        overlay = data_transfer.Overlay({'s': 0})
+        overlay.set_entry({'k': 0}, ['s'])
+        overlay.set_entry(5, ['s', 'k'])
+        overlay.set_entry(7, ['s'])
+        self.assertEqual(overlay.changes, {('s',): 7})
+        self.assertEqual(overlay.materialize(), {'s': 7})
+
+
+class TestCopy(unittest.TestCase):
+
+    def test_types_changed_in_place(self):
+        source_dict = {'a': {'sim_name': ['s', 'k'], 'value': 1}}
+        target_dict = {'s': {'k': 0, 'l': [1, 2]}}
+        data_transfer.dict_transfer(source_dict, target_dict)
+        target_dict['s']['l'] = (1, 2)
+        result, _ = data_transfer.dict_transfer(source_dict, target_dict)
+        self.assertEqual(result, {'s': {'k': 1, 'l': (1, 2)}})
+        self.assertIsInstance(result['s']['l'], tuple)
+
+    def test_not_serializable_leaves(self):
+        source_dict = {'a': {'sim_name': ['k'], 'value': 1}}
+        target_dict = {'k': 0, 'label': '\ud800', 'big': 2 ** 70}
+        result, _ = data_transfer.dict_transfer(source_dict, target_dict)
+        self.assertEqual(result, {'k': 1, 'label': '\ud800', 'big': 2 ** 70})
+
+    def test_shared_containers(self):
+        source_dict = {'a': {'sim_name': ['s', 'k'], 'value': 1}}
+        shared = {'v': 0}
+        target_dict = {'s': {'k': 0}, 'm': shared, 'n': shared}
+        result, _ = data_transfer.dict_transfer(source_dict, target_dict)
+        self.assertEqual(result, {'s': {'k': 1}, 'm': {'v': 0},
+                                  'n': {'v': 0}})
+        self.assertIs(result['m'], result['n'])
+        self.assertIsNot(result['m'], shared)
+
+
+if __name__ == '__main__':
+    unittest.main()